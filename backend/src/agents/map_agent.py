@@ -2,11 +2,21 @@
 Map Agent
 LangChain agent that performs map searches using natural language prompts
 """
+import anyio
+import asyncio
+import functools
+import hashlib
 import json
 import re
+import sys
+from datetime import datetime, timedelta, timezone
+
+from cachetools import TTLCache
+
 from langgraph.prebuilt import create_react_agent
+from langchain_core.messages import AIMessage, ToolMessage
 from langchain_openai import ChatOpenAI
-from src.core.settings import OPENROUTER_API_KEY, SYSTEM_PROMPT, OPENROUTER_BASE_URL
+from src.core.settings import DATABASE_URL, OPENROUTER_API_KEY, OPENROUTER_BASE_URL, get_system_prompts
 from src.tools.map_tools import (
     get_area_polygon,
     get_country_for_area,
@@ -21,15 +31,52 @@ TOOLS = [
     filter_places_by_categories,
 ]
 
+# Line-oriented place extraction: a list-item header line ("1. Name" or
+# "**Name**") opens an item, and the first following line with a coordinate
+# marker closes it. Only the coordinate pair itself needs a (tiny) regex.
+_ITEM_HEADER_RE = re.compile(r"(?:\d+\.\s+(?P<num_name>.+)|\*{2}(?P<bold_name>.+?)\*{2})\s*$")
+_COORD_RE = re.compile(r"(-?\d+(?:\.\d+)?)[,\s]+(-?\d+(?:\.\d+)?)")
+_COORD_MARKERS = ("📍", "🧭", "Coordinates", "Koordinat")
+
+
+def _coord_key(lat: float, lon: float) -> int:
+    """
+    Packs a coordinate pair into a single int for dedup, equivalent to
+    rounding both values to 4 decimals. Integer set members hash faster
+    and are much smaller than tuples of floats.
+    """
+    return (int(round(lat * 1e4)) << 22) | (int(round((lon + 180) * 1e4)) & 0x3FFFFF)
+
 
 def create_map_agent(model_name: str):
-    """Creates and returns a map agent."""
+    """Creates and returns a map agent (cached per model name)."""
     if not OPENROUTER_API_KEY:
         raise ValueError("OPENROUTER_API_KEY is not set. Please check your .env file.")
 
-    system_prompt = SYSTEM_PROMPT
-    if isinstance(system_prompt, dict):
-        system_prompt = system_prompt.get("system_prompt", "")
+    return _build_map_agent(model_name)
+
+
+def _get_system_prompt_text() -> str:
+    """
+    Returns the system prompt as a normalized string.
+    The dict-unwrapping happens here (not per request) and the result is
+    interned — every cached agent shares one copy of the 1-10 KB string.
+    """
+    prompts = get_system_prompts()
+    if isinstance(prompts, dict):
+        prompts = prompts.get("system_prompt", "")
+    return sys.intern(prompts)
+
+
+@functools.lru_cache(maxsize=16)
+def _build_map_agent(model_name: str):
+    """
+    Builds the ChatOpenAI client + ReAct graph for a model.
+    Both are deterministic in model_name and expensive to construct, so the
+    result is memoized — the httpx connection pool inside ChatOpenAI is then
+    reused across requests.
+    """
+    system_prompt = _get_system_prompt_text()
 
     model = ChatOpenAI(
         model=model_name,
@@ -141,7 +188,7 @@ def _extract_places_from_tool_json(messages: list) -> list[dict]:
                 if isinstance(item, dict):
                     place = _extract_place_from_item(item)
                     if place:
-                        key = (round(place["lat"], 4), round(place["lon"], 4))
+                        key = _coord_key(place["lat"], place["lon"])
                         if key not in seen:
                             seen.add(key)
                             places.append(place)
@@ -206,45 +253,59 @@ def _extract_places_from_messages(messages: list) -> list[dict]:
         if not content:
             continue
 
-        # Pattern 1: Numbered list with coordinates
-        # Match: "1. Name", then maybe some lines, then "Coordinates: lat, lon"
-        coord_blocks = re.findall(
-            r"^\s*(\d+\.\s+)(.+?)\s*\n(?:.*\n)*?.*?(?:📍|🧭|Coordinates?|Koordinat)[^\d\-]*?(-?\d+\.\d+),\s*(-?\d+\.\d+)",
-            content,
-            re.MULTILINE,
-        )
-        for prefix, name, lat, lon in coord_blocks:
-            name = name.strip().replace("**", "")
-            key = (round(float(lat), 4), round(float(lon), 4))
-            if key not in seen:
-                seen.add(key)
-                places.append({
-                    "name": name,
-                    "lat": float(lat),
-                    "lon": float(lon),
-                    "address": name,
-                    "source": "agent",
-                })
+        # Fast path: an item can only close on a line carrying one of the
+        # coordinate markers — skip the whole message otherwise.
+        if not any(marker in content for marker in _COORD_MARKERS):
+            continue
 
-        # Pattern 2: List without numbers (e.g. bold name)
-        # Match: "**Name**", then maybe some lines, then "Coordinates: lat, lon"
-        bold_blocks = re.findall(
-            r"^\s*\*{2}(.+?)\*{2}\s*\n(?:.*\n)*?.*?(?:📍|🧭|Coordinates?|Koordinat)[^\d\-]*?(-?\d+\.\d+),\s*(-?\d+\.\d+)",
-            content,
-            re.MULTILINE,
-        )
-        for name, lat, lon in bold_blocks:
-            name = name.strip()
-            key = (round(float(lat), 4), round(float(lon), 4))
+        # Single linear pass over the lines: remember the last list-item
+        # header ("1. Name" / "**Name**") and emit a place when a later line
+        # carries a coordinate marker followed by a "lat, lon" pair.
+        current_name = None
+        for line in content.splitlines():
+            header = _ITEM_HEADER_RE.match(line.strip())
+            if header:
+                name = header.group("num_name") or header.group("bold_name") or ""
+                current_name = name.strip().replace("**", "")
+                continue
+
+            if current_name is None:
+                continue
+
+            marker_idx = -1
+            for marker in _COORD_MARKERS:
+                marker_idx = line.find(marker)
+                if marker_idx != -1:
+                    break
+            if marker_idx == -1:
+                continue
+
+            coords = _COORD_RE.search(line, marker_idx)
+            if not coords:
+                continue
+
+            # "📍 Address: …" lines (nearby-search output) carry the marker
+            # and often a number pair too — housenumber plus a numbered
+            # street/neighborhood. The label between the marker and the
+            # first digit tells them apart from a real coordinate line;
+            # keep scanning the item's later lines for the actual pair.
+            label = line[marker_idx:coords.start()]
+            if "Address" in label or "Adres" in label:
+                continue
+
+            lat = float(coords.group(1))
+            lon = float(coords.group(2))
+            key = _coord_key(lat, lon)
             if key not in seen:
                 seen.add(key)
                 places.append({
-                    "name": name,
-                    "lat": float(lat),
-                    "lon": float(lon),
-                    "address": name,
+                    "name": current_name,
+                    "lat": lat,
+                    "lon": lon,
+                    "address": current_name,
                     "source": "agent",
                 })
+            current_name = None
 
     return places
 
@@ -267,9 +328,106 @@ def _extract_polygon_from_messages(messages: list) -> dict | None:
     return None
 
 
+# Response cache for repeated prompts — identical requests skip the LLM round-trip.
+# Per-key locks coalesce concurrent duplicates so only one agent run hits OpenRouter.
+_RESPONSE_CACHE: TTLCache = TTLCache(maxsize=512, ttl=900)
+_RESPONSE_CACHE_LOCKS: dict[tuple[str, str], asyncio.Lock] = {}
+_CACHE_STATS = {"hits": 0, "db_hits": 0, "misses": 0}
+
+# How long a stored prompt→response mapping stays trustworthy.
+_KNOWN_PROMPT_MAX_AGE_DAYS = 7
+
+# One compiled scan decides whether a response is a failure/no-result text
+# (those are never cached) — avoids repeated .lower() copies of large bodies.
+_NO_RESULT_RE = re.compile(r"sonuç bulamadım|no results|agent error", re.IGNORECASE)
+
+
+def _prompt_hash(prompt: str, model_name: str) -> str:
+    """Stable hash for a normalized (prompt, model) pair."""
+    normalized = f"{prompt.strip().casefold()}|{model_name}"
+    return hashlib.sha1(normalized.encode("utf-8")).hexdigest()
+
+
+def _load_known_response(prompt_hash: str) -> dict | None:
+    """
+    Best-effort lookup in the known-prompt table.
+    Returns the stored response dict if a fresh row exists, None on a miss
+    or any DB problem (the cache must never break the agent path).
+    """
+    if not DATABASE_URL:
+        return None
+    try:
+        from src.database.db import get_engine
+        from src.database.models.prompt_cache import PromptToPlaces
+
+        session = get_engine().session()
+        try:
+            cutoff = datetime.now(timezone.utc) - timedelta(days=_KNOWN_PROMPT_MAX_AGE_DAYS)
+            row = (
+                session.query(PromptToPlaces)
+                .filter(
+                    PromptToPlaces.prompt_hash == prompt_hash,
+                    PromptToPlaces.created_at > cutoff,
+                )
+                .first()
+            )
+            return row.response if row else None
+        finally:
+            session.close()
+    except Exception:
+        return None
+
+
+def _store_known_response(prompt_hash: str, model_name: str, response: dict) -> None:
+    """Best-effort upsert of a successful response into the known-prompt table."""
+    if not DATABASE_URL:
+        return
+    try:
+        from src.database.db import get_engine
+        from src.database.models.prompt_cache import PromptToPlaces
+        from sqlalchemy.sql import func
+
+        session = get_engine().session()
+        try:
+            row = (
+                session.query(PromptToPlaces)
+                .filter(PromptToPlaces.prompt_hash == prompt_hash)
+                .first()
+            )
+            if row:
+                row.model_name = model_name
+                row.response = response
+                row.created_at = func.now()
+            else:
+                session.add(PromptToPlaces(
+                    prompt_hash=prompt_hash,
+                    model_name=model_name,
+                    response=response,
+                ))
+            session.commit()
+        finally:
+            session.close()
+    except Exception:
+        pass
+
+
+def get_cache_stats() -> dict:
+    """Returns hit/miss counters and current size of the response cache."""
+    return {
+        "hits": _CACHE_STATS["hits"],
+        "db_hits": _CACHE_STATS["db_hits"],
+        "misses": _CACHE_STATS["misses"],
+        "size": len(_RESPONSE_CACHE),
+        "maxsize": _RESPONSE_CACHE.maxsize,
+        "ttl": _RESPONSE_CACHE.ttl,
+    }
+
+
 async def run_map_agent(prompt: str, model_name: str) -> dict:
     """
     Runs the map agent with the given prompt.
+    Identical (prompt, model_name) pairs within the cache TTL return the
+    cached response without invoking the LLM again.
     Args:
         prompt: User's natural language request
                 Example: 'List the best restaurants in Kadıköy'
@@ -277,6 +435,53 @@ async def run_map_agent(prompt: str, model_name: str) -> dict:
     Returns:
         dict: Agent's response
     """
+    cache_key = (prompt.strip().casefold(), model_name)
+
+    cached = _RESPONSE_CACHE.get(cache_key)
+    if cached is not None:
+        _CACHE_STATS["hits"] += 1
+        return cached
+
+    lock = _RESPONSE_CACHE_LOCKS.setdefault(cache_key, asyncio.Lock())
+    try:
+        async with lock:
+            # Re-check: a concurrent duplicate may have populated the cache
+            # while we waited on the lock.
+            cached = _RESPONSE_CACHE.get(cache_key)
+            if cached is not None:
+                _CACHE_STATS["hits"] += 1
+                return cached
+
+            # Known-prompt layer: a fresh stored response bypasses the LLM.
+            # The sync DB calls run on a worker thread so they never block the
+            # event loop for other requests.
+            prompt_hash = _prompt_hash(prompt, model_name)
+            known = await anyio.to_thread.run_sync(_load_known_response, prompt_hash)
+            if known is not None:
+                _CACHE_STATS["db_hits"] += 1
+                _RESPONSE_CACHE[cache_key] = known
+                return known
+
+            _CACHE_STATS["misses"] += 1
+            result = await _run_map_agent(prompt, model_name)
+
+            # Don't cache failures or empty results — the next attempt may succeed.
+            if not _NO_RESULT_RE.search(result["response"]):
+                _RESPONSE_CACHE[cache_key] = result
+                await anyio.to_thread.run_sync(
+                    _store_known_response, prompt_hash, model_name, result
+                )
+        return result
+    finally:
+        # Runs on cancellation too, so a disconnected client can't leak the
+        # entry; only remove it while it still maps to our lock — a later
+        # waiter may already have re-created the key with a fresh lock.
+        if _RESPONSE_CACHE_LOCKS.get(cache_key) is lock:
+            del _RESPONSE_CACHE_LOCKS[cache_key]
+
+
+async def _run_map_agent(prompt: str, model_name: str) -> dict:
+    """Runs the agent without caching; see run_map_agent."""
     structured_places = []
     center = None
     response_text = ""
@@ -299,9 +504,17 @@ async def run_map_agent(prompt: str, model_name: str) -> dict:
             elif isinstance(last_message, dict):
                 response_text = last_message.get("content", "") or ""
 
-        # Extract structured places from tool JSON outputs first (most reliable)
-        tool_messages = [m for m in messages if type(m).__name__ == "ToolMessage" and getattr(m, "content", "")]
-        final_ai_messages = [m for m in messages if type(m).__name__ == "AIMessage" and getattr(m, "content", "")]
+        # Partition messages in one pass (tool outputs are the most reliable
+        # source of structured places, AI messages are the fallback)
+        tool_messages = []
+        final_ai_messages = []
+        for m in messages:
+            if not getattr(m, "content", ""):
+                continue
+            if isinstance(m, ToolMessage):
+                tool_messages.append(m)
+            elif isinstance(m, AIMessage):
+                final_ai_messages.append(m)
 
         structured_places = _extract_places_from_tool_json(tool_messages)
         polygon = _extract_polygon_from_messages(tool_messages)
@@ -1,4 +1,7 @@
+import functools
 import os
+from pathlib import Path
+
 from dotenv import load_dotenv
 
 from src.utils.read_json import load_system_prompts
@@ -11,8 +14,24 @@ DATABASE_URL = os.getenv("DATABASE_URL")
 GOOGLE_MAPS_API_KEY = os.getenv("GOOGLE_MAPS_API_KEY")
 # OpenAI API Key
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
-# System Prompt
-SYSTEM_PROMPT = load_system_prompts()
+# System Prompts — loaded lazily via get_system_prompts() instead of at import
+# time, so module import does no disk I/O and prompt edits are picked up
+# without a restart.
+_SYSTEM_PROMPTS_PATH = Path(__file__).parent.parent / "static" / "system_prompts.json"
+
+
+@functools.lru_cache(maxsize=4)
+def _load_system_prompts_cached(mtime: float) -> dict:
+    return load_system_prompts()
+
+
+def get_system_prompts() -> dict:
+    """Returns the system prompts dict, re-reading the file when it changes."""
+    try:
+        mtime = _SYSTEM_PROMPTS_PATH.stat().st_mtime
+    except OSError:
+        mtime = 0.0
+    return _load_system_prompts_cached(mtime)
 # OpenRouter API
 OPENROUTER_API_KEY = os.getenv("OPENROUTER_API_KEY")
 OPENROUTER_BASE_URL = os.getenv("OPENROUTER_BASE_URL")
@@ -1,4 +1,5 @@
 import os
+import threading
 
 from sqlalchemy import create_engine, text
 from sqlalchemy.orm import sessionmaker
@@ -7,41 +8,36 @@ from src.core.settings import DATABASE_URL
 from src.database import Base
 
 
-class Engine(BaseException):
+class Engine:
     def __init__(self):
         self.engine = create_engine(DATABASE_URL,
         pool_pre_ping = True,
         echo = os.getenv("DEBUG", "False").lower() == "true",
         pool_size = 10,
         max_overflow = 20,
+        pool_recycle = 1800,
+        pool_reset_on_return = "rollback",
         )
         self.session = sessionmaker(bind=self.engine,
                                     autocommit=False,
                                     autoflush=False,)
 
-    def get_db(self):
-        db = self.session()
-        try:
-            yield db
-        finally:
-            db.close()
-
     def init_db(self):
-        print("=' Initializing database...")
+        print("Initializing database...")
 
         # PostGIS extension
         with self.engine.connect() as conn:
             try:
                 conn.execute(text("CREATE EXTENSION IF NOT EXISTS postgis;"))
                 conn.commit()
-                print(" PostGIS extension enabled")
+                print("PostGIS extension enabled")
             except Exception as e:
-                print(f"�  PostGIS warning: {e}")
+                print(f"PostGIS warning: {e}")
 
-        from models import place, user  # noqa
+        from src.database.models import place, prompt_cache, user  # noqa
         Base.metadata.create_all(bind=self.engine)
-        print(" Database tables created successfully")
-        print(" Database initialization complete")
+        print("Database tables created successfully")
+        print("Database initialization complete")
 
     def test_connection(self):
         """
@@ -51,17 +47,41 @@ class Engine(BaseException):
             with self.engine.connect() as conn:
                 result = conn.execute(text("SELECT version();"))
                 version = result.fetchone()[0]
-                print(f" PostgreSQL connected: {version}")
+                print(f"PostgreSQL connected: {version}")
 
                 # Control PostGIS version
                 try:
                     result = conn.execute(text("SELECT PostGIS_Version();"))
                     postgis_version = result.fetchone()[0]
-                    print(f" PostGIS version: {postgis_version}")
+                    print(f"PostGIS version: {postgis_version}")
                 except:
-                    print("�  PostGIS not installed")
+                    print("PostGIS not installed")
 
             return True
         except Exception as e:
-            print(f"L Database connection failed: {e}")
-            return False
\ No newline at end of file
+            print(f"Database connection failed: {e}")
+            return False
+
+
+# Process-wide singleton — every caller shares one engine and one pool.
+_engine_instance: Engine | None = None
+_engine_lock = threading.Lock()
+
+
+def get_engine() -> Engine:
+    """Returns the shared Engine, creating it lazily on first use."""
+    global _engine_instance
+    if _engine_instance is None:
+        with _engine_lock:
+            if _engine_instance is None:
+                _engine_instance = Engine()
+    return _engine_instance
+
+
+def get_db():
+    """FastAPI dependency: yields a session bound to the shared engine."""
+    db = get_engine().session()
+    try:
+        yield db
+    finally:
+        db.close()
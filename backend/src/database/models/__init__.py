@@ -1,8 +1,9 @@
 """
 Models package
-T�m database modelleri burada import edilir
+Tüm database modelleri burada import edilir
 """
-from models.place import Place
-from models.user import User, SearchHistory
+from src.database.models.place import Place
+from src.database.models.prompt_cache import PromptToPlaces
+from src.database.models.user import User, SearchHistory
 
-__all__ = ["Place", "User", "SearchHistory"]
+__all__ = ["Place", "PromptToPlaces", "User", "SearchHistory"]
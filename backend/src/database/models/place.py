@@ -2,8 +2,11 @@
 Place Model - PostgreSQL + PostGIS
 Model for restaurants, cafes and other places
 """
-from sqlalchemy import Column, Integer, String, Float, Boolean, DateTime, Text, JSON
-from sqlalchemy.sql import func
+import csv
+import io
+
+from sqlalchemy import Column, Computed, Index, Integer, String, Float, Boolean, DateTime, Text, JSON
+from sqlalchemy.sql import desc, func
 from geoalchemy2 import Geography
 from src.database.db import Base
 
@@ -17,6 +20,14 @@ class Place(Base):
     """
     __tablename__ = "places"
 
+    # Index strategy: the hot read is "places of a category, best first",
+    # served by one composite scan below. Spatial lookups are covered by the
+    # GiST index on `location`; if time-range scans over created_at ever get
+    # hot, a BRIN index is the cheap fit there (append-only, correlated).
+    __table_args__ = (
+        Index("ix_places_category_rating", "category", desc("rating")),
+    )
+
     # Primary Key
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
 
@@ -26,8 +37,10 @@ class Place(Base):
     address = Column(Text, nullable=True)
     street = Column(Text, nullable=True)
     postal_code = Column(String(20), nullable=True)
-    latitude = Column(Float, nullable=False)
-    longitude = Column(Float, nullable=False)
+    # Derived from `location` (single source of truth) — generated columns keep
+    # the convenient Float accessors without writing the coordinate three times.
+    latitude = Column(Float, Computed("ST_Y(location::geometry)", persisted=True))
+    longitude = Column(Float, Computed("ST_X(location::geometry)", persisted=True))
     website = Column(String(500), nullable=True)
     phone = Column(String(50), nullable=True)
     category = Column(String(100), nullable=True)
@@ -49,6 +62,62 @@ class Place(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
+    # Columns written by bulk_copy — latitude/longitude are generated from
+    # `location` and must not appear in the COPY column list.
+    _COPY_COLUMNS = (
+        "google_place_id", "name", "address", "street", "postal_code",
+        "website", "phone", "category", "business_category", "type",
+        "subtypes", "location", "review_tags", "description", "rating",
+        "review", "price_range", "city", "country",
+    )
+
+    @classmethod
+    def bulk_copy(cls, rows, engine=None) -> int:
+        """
+        Bulk-inserts places using PostgreSQL COPY FROM STDIN.
+        Orders of magnitude faster than per-row session.add() loops for
+        ingestion batches, since rows stream through one statement.
+
+        Args:
+            rows: iterable of dicts with Place column values; 'latitude' and
+                  'longitude' keys are used to build the geography point.
+            engine: SQLAlchemy engine (defaults to the shared one).
+        Returns:
+            Number of rows written.
+        """
+        if engine is None:
+            from src.database.db import get_engine
+            engine = get_engine().engine
+
+        buf = io.StringIO()
+        writer = csv.writer(buf)
+        count = 0
+        for row in rows:
+            # Geography accepts EWKT in COPY text input
+            location = f"SRID=4326;POINT({float(row['longitude'])} {float(row['latitude'])})"
+            writer.writerow([
+                row.get(col) if col != "location" else location
+                for col in cls._COPY_COLUMNS
+            ])
+            count += 1
+
+        if not count:
+            return 0
+
+        buf.seek(0)
+        columns = ", ".join(cls._COPY_COLUMNS)
+        raw = engine.raw_connection()
+        try:
+            with raw.cursor() as cur:
+                cur.copy_expert(
+                    f"COPY {cls.__tablename__} ({columns}) FROM STDIN WITH (FORMAT csv)",
+                    buf,
+                )
+            raw.commit()
+        finally:
+            raw.close()
+        return count
+
     def __repr__(self):
         return f"<Place(id={self.id}, name='{self.name}', rating={self.rating})>"
     def to_dict(self):
@@ -0,0 +1,28 @@
+"""
+Prompt Cache Model
+Maps a normalized prompt hash to the agent response that answered it,
+so repeated prompts can bypass the LLM entirely.
+"""
+from sqlalchemy import Column, Integer, String, DateTime, JSON
+from sqlalchemy.sql import func
+from src.database.db import Base
+
+
+class PromptToPlaces(Base):
+    """
+    Known-prompt cache.
+
+    One row per distinct (prompt, model) hash holding the full agent
+    response dict. Rows older than the freshness window are ignored
+    and overwritten on the next successful run.
+    """
+    __tablename__ = "prompt_to_places"
+
+    id = Column(Integer, primary_key=True, index=True, autoincrement=True)
+    prompt_hash = Column(String(40), unique=True, index=True, nullable=False)
+    model_name = Column(String(100), nullable=True)
+    response = Column(JSON, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    def __repr__(self):
+        return f"<PromptToPlaces(id={self.id}, prompt_hash='{self.prompt_hash}')>"
@@ -10,11 +10,19 @@ from fastapi.responses import JSONResponse, StreamingResponse
 
 from src.core.settings import PLACEMAKING_API_URL
 from src.schemas.agent import MapAgentRequest, MapAgentResponse
-from src.agents.map_agent import run_map_agent, create_map_agent, _extract_places_from_messages
+from src.agents.map_agent import run_map_agent, create_map_agent, get_cache_stats, _extract_places_from_messages
 
 router = APIRouter()
 
 
+@router.get("/map/cache/stats", summary="Map agent response cache statistics")
+async def map_agent_cache_stats():
+    """
+    Returns hit/miss counters and current size of the agent response cache.
+    """
+    return get_cache_stats()
+
+
 @router.post("/map", response_model=MapAgentResponse, summary="Search places with Map Agent")
 async def map_agent_search(request: MapAgentRequest):
     """
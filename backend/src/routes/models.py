@@ -4,17 +4,31 @@ Fetch OpenRouter models and return GPT/Gemini only.
 """
 from __future__ import annotations
 
-from fastapi import APIRouter, HTTPException
+import re
+
+from cachetools import TTLCache
+from fastapi import APIRouter, HTTPException, Request
 import httpx
 
 from src.core.settings import OPENROUTER_API_KEY, OPENROUTER_BASE_URL
 
 router = APIRouter()
 
+# One regex match per model id replaces the lower()+startswith+in checks.
+_MODEL_RE = re.compile(r"^(?:openai/[^\s]*gpt|google/[^\s]*gemini)", re.IGNORECASE)
+
+# The OpenRouter catalog changes rarely — cache the filtered list per base URL
+# so repeated calls skip the upstream round-trip entirely.
+_MODELS_CACHE: TTLCache = TTLCache(maxsize=4, ttl=600)
+
 
 @router.get("/openrouter", summary="List OpenRouter GPT/Gemini models")
-async def list_openrouter_models():
+async def list_openrouter_models(request: Request):
     base_url = (OPENROUTER_BASE_URL or "https://openrouter.ai/api/v1").rstrip("/")
+    cached = _MODELS_CACHE.get(base_url)
+    if cached is not None:
+        return cached
+
     url = f"{base_url}/models"
 
     headers = {}
@@ -22,8 +36,8 @@ async def list_openrouter_models():
         headers["Authorization"] = f"Bearer {OPENROUTER_API_KEY}"
 
     try:
-        async with httpx.AsyncClient(timeout=20.0) as client:
-            resp = await client.get(url, headers=headers)
+        # Shared client from app startup — reuses pooled connections.
+        resp = await request.app.state.http.get(url, headers=headers)
         resp.raise_for_status()
     except httpx.HTTPStatusError as exc:
         raise HTTPException(status_code=exc.response.status_code, detail="OpenRouter request failed")
@@ -36,12 +50,10 @@ async def list_openrouter_models():
     filtered = []
     for item in items:
         model_id = str(item.get("id", ""))
-        name = str(item.get("name", model_id))
-        model_id_lower = model_id.lower()
-        if model_id_lower.startswith("openai/") and "gpt" in model_id_lower:
-            filtered.append({"id": model_id, "name": name})
-        elif model_id_lower.startswith("google/") and "gemini" in model_id_lower:
-            filtered.append({"id": model_id, "name": name})
+        if _MODEL_RE.match(model_id):
+            filtered.append({"id": model_id, "name": str(item.get("name", model_id))})
 
     filtered.sort(key=lambda m: m["name"].lower())
-    return {"data": filtered}
+    response = {"data": filtered}
+    _MODELS_CACHE[base_url] = response
+    return response
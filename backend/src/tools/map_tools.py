@@ -4,11 +4,19 @@ LangChain tools for map searches using OpenStreetMap (Nominatim + Overpass)
 """
 from __future__ import annotations
 
+import asyncio
+import functools
 import json
 import re
+import threading
+import time
+import unicodedata
+from itertools import islice
 from typing import Optional, Any
 
 import httpx
+import orjson
+from cachetools import TTLCache
 from langchain.tools import tool
 
 from src.core.settings import NOMINATIM_EMAIL, NOMINATIM_USER_AGENT, PLACEMAKING_API_URL
@@ -22,6 +30,20 @@ OVERPASS_MIRRORS = [
 ]
 USER_AGENT = NOMINATIM_USER_AGENT or "AgenticMapApp/1.0 (contact: dev@example.com)"
 
+# Long-lived clients — keep-alive reuses the TCP+TLS connection across tool
+# calls instead of paying a fresh handshake per request.
+_NOMINATIM_ASYNC_CLIENT = httpx.AsyncClient(
+    base_url=NOMINATIM_BASE,
+    headers={"User-Agent": USER_AGENT},
+    timeout=20.0,
+    limits=httpx.Limits(max_keepalive_connections=10, max_connections=20),
+)
+_OVERPASS_ASYNC_CLIENT = httpx.AsyncClient(
+    headers={"User-Agent": USER_AGENT},
+    timeout=25.0,
+    limits=httpx.Limits(max_keepalive_connections=10, max_connections=20),
+)
+
 # Placemaking API countries endpoint
 PLACEMAKING_COUNTRIES_URL = "https://placemaking.test.brick-n-data.com/every-data/locations/get-country"
 _PLACEMAKING_COUNTRIES_CACHE: list[dict] | None = None
@@ -30,30 +52,150 @@ _PLACEMAKING_COUNTRIES_CACHE: list[dict] | None = None
 _LAST_SEARCH_RESULTS: list[dict] = []
 
 
-def _nominatim_get(path: str, params: dict) -> dict | list:
-    if NOMINATIM_EMAIL:
-        params = {**params, "email": NOMINATIM_EMAIL}
-    headers = {"User-Agent": USER_AGENT}
-    url = f"{NOMINATIM_BASE}{path}"
-    with httpx.Client(timeout=20.0, headers=headers) as client:
-        resp = client.get(url, params=params)
-        resp.raise_for_status()
-        return resp.json()
+# Upstream responses barely change within an hour — identical Nominatim and
+# Overpass requests are served from this cache instead of going over the wire.
+# Tool coroutines may run on different worker threads, so guarded by a lock.
+_HTTP_CACHE: TTLCache = TTLCache(maxsize=2048, ttl=3600)
+# Negative cache: empty responses are remembered too, so a repeated miss
+# skips the whole multi-tier fallback cascade — but only briefly, since
+# "no results" goes stale much faster than a hit.
+_HTTP_NEG_CACHE: TTLCache = TTLCache(maxsize=2048, ttl=600)
+_HTTP_CACHE_LOCK = threading.Lock()
+
+
+def _http_cache_get(key):
+    with _HTTP_CACHE_LOCK:
+        value = _HTTP_CACHE.get(key)
+        if value is None:
+            value = _HTTP_NEG_CACHE.get(key)
+        return value
+
+
+def _http_cache_put(key, value, is_empty: bool | None = None) -> None:
+    # Callers whose empty payload is still truthy (an empty Overpass
+    # response is an envelope dict with "elements": []) pass is_empty
+    # explicitly; plain truthiness covers Nominatim's bare lists.
+    if is_empty is None:
+        is_empty = not value
+    with _HTTP_CACHE_LOCK:
+        (_HTTP_NEG_CACHE if is_empty else _HTTP_CACHE)[key] = value
+
+
+def _nominatim_cache_key(path: str, params: dict) -> tuple:
+    return ("nominatim", path, tuple(sorted(params.items())))
+
+
+# Delay before each additional hedged mirror request is launched — a healthy
+# first mirror answers well within this, so hedges rarely cost extra traffic.
+_OVERPASS_HEDGE_DELAY_S = 3.0
+
+# Per-mirror health: failed mirrors get an exponentially growing cooldown so
+# a dead mirror isn't retried (and timed out on) every call, and an EWMA of
+# response latency orders the healthy mirrors fastest-first.
+_MIRROR_LOCK = threading.Lock()
+_MIRROR_COOLDOWN_UNTIL: dict[str, float] = {}
+_MIRROR_BACKOFF_S: dict[str, float] = {}
+_MIRROR_EWMA_LATENCY: dict[str, float] = {}
+_MIRROR_BACKOFF_MIN_S = 30.0
+_MIRROR_BACKOFF_MAX_S = 600.0
+_MIRROR_EWMA_ALPHA = 0.3
+
+
+def _mirror_candidates() -> list[str]:
+    """Deduped mirror list: healthy ones ordered fastest-first; if every
+    mirror is in cooldown, all are returned so requests still go out."""
+    now = time.monotonic()
+    mirrors = list(dict.fromkeys(OVERPASS_MIRRORS))
+    with _MIRROR_LOCK:
+        healthy = [m for m in mirrors if _MIRROR_COOLDOWN_UNTIL.get(m, 0.0) <= now]
+        pool = healthy or mirrors
+        return sorted(pool, key=lambda m: _MIRROR_EWMA_LATENCY.get(m, 0.0))
+
+
+def _record_mirror_success(mirror: str, elapsed: float) -> None:
+    with _MIRROR_LOCK:
+        _MIRROR_BACKOFF_S.pop(mirror, None)
+        _MIRROR_COOLDOWN_UNTIL.pop(mirror, None)
+        prev = _MIRROR_EWMA_LATENCY.get(mirror)
+        _MIRROR_EWMA_LATENCY[mirror] = (
+            elapsed if prev is None
+            else _MIRROR_EWMA_ALPHA * elapsed + (1 - _MIRROR_EWMA_ALPHA) * prev
+        )
 
 
-def _overpass_query(query: str) -> dict:
-    """Tries each Overpass mirror in order; returns first successful result."""
-    headers = {"User-Agent": USER_AGENT}
-    last_exc: Exception | None = None
-    for mirror in OVERPASS_MIRRORS:
+def _record_mirror_failure(mirror: str) -> None:
+    with _MIRROR_LOCK:
+        backoff = min(
+            _MIRROR_BACKOFF_S.get(mirror, _MIRROR_BACKOFF_MIN_S / 2) * 2,
+            _MIRROR_BACKOFF_MAX_S,
+        )
+        _MIRROR_BACKOFF_S[mirror] = backoff
+        _MIRROR_COOLDOWN_UNTIL[mirror] = time.monotonic() + backoff
+
+
+async def _nominatim_get_async(path: str, params: dict) -> dict | list:
+    if NOMINATIM_EMAIL:
+        params = {**params, "email": NOMINATIM_EMAIL}
+    key = _nominatim_cache_key(path, params)
+    cached = _http_cache_get(key)
+    if cached is not None:
+        return cached
+    resp = await _NOMINATIM_ASYNC_CLIENT.get(path, params=params)
+    resp.raise_for_status()
+    data = orjson.loads(resp.content)
+    _http_cache_put(key, data)
+    return data
+
+
+async def _overpass_query_async(query: str) -> dict:
+    """
+    Async variant of _overpass_query with staggered hedging: mirror N is
+    launched N * hedge-delay after the first, and the first successful
+    response wins while the stragglers are cancelled.
+    """
+    key = ("overpass", query)
+    cached = _http_cache_get(key)
+    if cached is not None:
+        return cached
+
+    async def fetch_staggered(idx: int, mirror: str) -> dict:
+        if idx:
+            await asyncio.sleep(idx * _OVERPASS_HEDGE_DELAY_S)
+        start = time.monotonic()
         try:
-            with httpx.Client(timeout=25.0, headers=headers) as client:
-                resp = client.post(mirror, data={"data": query})
-                resp.raise_for_status()
-                return resp.json()
-        except Exception as exc:
-            last_exc = exc
-            continue
+            resp = await _OVERPASS_ASYNC_CLIENT.post(mirror, data={"data": query})
+            resp.raise_for_status()
+            data = orjson.loads(resp.content)
+        except Exception:
+            _record_mirror_failure(mirror)
+            raise
+        _record_mirror_success(mirror, time.monotonic() - start)
+        return data
+
+    tasks = [
+        asyncio.create_task(fetch_staggered(i, mirror))
+        for i, mirror in enumerate(_mirror_candidates())
+    ]
+    last_exc: Exception | None = None
+    try:
+        pending = set(tasks)
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                try:
+                    data = task.result()
+                except Exception as exc:
+                    last_exc = exc
+                    continue
+                _http_cache_put(key, data, is_empty=not data.get("elements"))
+                return data
+    finally:
+        for task in tasks:
+            task.cancel()
+        # Collect the stragglers — an abandoned mirror task that errors in
+        # the same wave as the winner would otherwise log "Task exception
+        # was never retrieved".
+        await asyncio.gather(*tasks, return_exceptions=True)
     raise last_exc or RuntimeError("All Overpass mirrors failed")
 
 
@@ -83,6 +225,39 @@ def _fetch_placemaking_countries() -> list[dict]:
     return _PLACEMAKING_COUNTRIES_CACHE
 
 
+# Per-place output templates, built once — each result line is a single
+# str.format call instead of a nested f-string tree.
+_PLACE_TMPL = (
+    "{i}. {name}\n"
+    "   📍 Coordinates: {lat}, {lon}\n"
+    "   🏠 Address: {addr}\n"
+    "   🧭 Category: {cat}\n"
+    "   🆔 OSM: {otype}/{oid}\n"
+)
+_NEARBY_NOMINATIM_TMPL = (
+    "{i}. {name}\n"
+    "   📍 Coordinates: {lat}, {lon}\n"
+    "   🏠 Address: {addr}\n"
+)
+_NEARBY_OVERPASS_TMPL = (
+    "{i}. {name}\n"
+    "   📍 Address: {addr}\n"
+    "   🧭 Coordinates: {lat}, {lon}\n"
+    "   🆔 OSM: {otype}/{oid}\n"
+)
+
+
+def _short_name(place: dict) -> str:
+    """Best display name for a Nominatim result, namedetails read once."""
+    namedetails = place.get("namedetails") or {}
+    return (
+        namedetails.get("name")
+        or namedetails.get("name:tr")
+        or namedetails.get("name:en")
+        or place.get("display_name", "Unknown").partition(",")[0].strip()
+    )
+
+
 def _format_address(tags: dict) -> str:
     parts = [
         tags.get("addr:street"),
@@ -94,32 +269,19 @@ def _format_address(tags: dict) -> str:
     return ", ".join([p for p in parts if p]) or "No address"
 
 
-def _nominatim_search_structured(query: str) -> list[dict]:
-    """Returns structured place list from Nominatim for the given query."""
-    results = _nominatim_get(
-        "/search",
-        {"q": query, "format": "json", "addressdetails": 1, "namedetails": 1, "limit": 20},
+def _format_overpass_element(i: int, element: dict) -> str:
+    """One formatted result line for an Overpass element (node/way/relation)."""
+    tags = element.get("tags", {})
+    center = element.get("center") or {"lat": element.get("lat"), "lon": element.get("lon")}
+    return _NEARBY_OVERPASS_TMPL.format(
+        i=i,
+        name=tags.get("name") or tags.get("name:tr") or tags.get("name:en") or "Unknown",
+        addr=_format_address(tags),
+        lat=center.get("lat"),
+        lon=center.get("lon"),
+        otype=element.get("type"),
+        oid=element.get("id"),
     )
-    places = []
-    for place in results:
-        lat = place.get("lat")
-        lon = place.get("lon")
-        if lat and lon:
-            namedetails = place.get("namedetails", {})
-            name = (
-                namedetails.get("name")
-                or namedetails.get("name:tr")
-                or namedetails.get("name:en")
-                or place.get("display_name", "Unknown").split(",")[0].strip()
-            )
-            places.append({
-                "name": name,
-                "lat": float(lat),
-                "lon": float(lon),
-                "address": place.get("display_name", ""),
-                "source": "nominatim",
-            })
-    return places
 
 
 _TR_TO_EN = {
@@ -162,25 +324,57 @@ _CATEGORY_SYNONYMS = {
 }
 
 
+# Prefix trie over the _TR_TO_EN stems: translating a word is one walk over
+# its characters (longest matching stem wins) instead of a startswith probe
+# per dictionary key.
+_TRIE_VALUE = "\0"  # sentinel key holding the English value at terminal nodes
+
+# casefold() alone cannot align Turkish case pairs: it is locale-independent,
+# so "I" never folds to dotless "ı" ("FIRIN".casefold() is "firin") and "İ"
+# folds to "i" plus a combining dot. Folding both the stems and the query
+# words down to ASCII makes every casing variant land on the same trie path.
+_TR_ASCII_FOLD = str.maketrans("ıüöşçğ", "iuoscg")
+
+
+def _fold_tr(text: str) -> str:
+    """ASCII-folds Turkish text for lookup: NFKC, casefold, ı/ü/ö/ş/ç/ğ to
+    ASCII, and the combining dot that casefold leaves behind for "İ"."""
+    folded = unicodedata.normalize("NFKC", text).casefold()
+    return folded.translate(_TR_ASCII_FOLD).replace("\u0307", "")
+
+
+def _build_tr_trie() -> dict:
+    trie: dict = {}
+    for stem, english in _TR_TO_EN.items():
+        node = trie
+        for ch in _fold_tr(stem):
+            node = node.setdefault(ch, {})
+        node[_TRIE_VALUE] = english
+    return trie
+
+
+_TR_TRIE = _build_tr_trie()
+
+
+@functools.lru_cache(maxsize=1024)
 def _translate_query(query: str) -> str:
     """Translates Turkish place type keywords to English for better Nominatim results."""
-    words = query.split()
+    # The query is folded once with the same ASCII fold the trie stems were
+    # built with, so "FIRIN", "Fırın" and "firin" all reach the "fırın" stem.
+    folded = _fold_tr(query)
     translated = []
-    for w in words:
-        w_lower = w.lower()
-        # Exact match first
-        if w_lower in _TR_TO_EN:
-            translated.append(_TR_TO_EN[w_lower])
-            continue
-        # Stem match: check if word starts with any known Turkish keyword
-        matched = False
-        for tr_key, en_val in _TR_TO_EN.items():
-            if w_lower.startswith(tr_key):
-                translated.append(en_val)
-                matched = True
+    for w, w_folded in zip(query.split(), folded.split()):
+        # Walk the trie along the folded word; the deepest terminal node
+        # seen is the longest stem match (covers exact matches too).
+        node = _TR_TRIE
+        match = None
+        for ch in w_folded:
+            node = node.get(ch)
+            if node is None:
                 break
-        if not matched:
-            translated.append(w)
+            if _TRIE_VALUE in node:
+                match = node[_TRIE_VALUE]
+        translated.append(match if match is not None else w)
     return " ".join(translated)
 
 
@@ -200,13 +394,24 @@ _AMENITY_TYPES = {
 }
 
 
+# One alternation over the amenity keywords, compiled once — used both to
+# detect the amenity (single scan instead of one substring probe per keyword)
+# and to strip the keywords out of the query.
+_AMENITY_RE = re.compile(
+    r"\b(" + "|".join(re.escape(k) for k in _AMENITY_TYPES) + r")\b",
+    re.IGNORECASE,
+)
+
+
 def _extract_amenity(query: str) -> Optional[str]:
     """Extracts amenity type from query string."""
-    q_lower = query.lower()
-    for keyword, amenity in _AMENITY_TYPES.items():
-        if keyword in q_lower:
-            return amenity
-    return None
+    m = _AMENITY_RE.search(query)
+    return _AMENITY_TYPES[m.group(1).lower()] if m else None
+
+
+def _extract_amenity_any(*queries: str) -> Optional[str]:
+    """Extracts amenity type from several query variants with one scan."""
+    return _extract_amenity(" ".join(queries))
 
 
 # Fallback country code to English name mapping (for when Placemaking API fails)
@@ -240,7 +445,7 @@ _COUNTRY_CODE_TO_NAME = {
 
 
 @tool
-def get_country_for_area(area_name: str) -> str:
+async def get_country_for_area(area_name: str) -> str:
     """
     Determines the correct Placemaking-compatible country name for a given area.
     Call this BEFORE search_places_in_polygon to get the correct country value.
@@ -252,7 +457,7 @@ def get_country_for_area(area_name: str) -> str:
     """
     try:
         # Step 1: Nominatim reverse lookup → get country_code + country name
-        results = _nominatim_get("/search", {
+        results = await _nominatim_get_async("/search", {
             "q": area_name, "format": "json", "limit": 1, "addressdetails": 1
         })
         if not results:
@@ -261,9 +466,10 @@ def get_country_for_area(area_name: str) -> str:
         address = results[0].get("address", {})
         country_code = address.get("country_code", "").upper()    # e.g., "TR"
 
-        # Step 2: Fetch Placemaking countries list (cached after first call)
+        # Step 2: Fetch Placemaking countries list (cached after first call);
+        # the sync fetch runs on a worker thread so it can't block the loop
         try:
-            countries = _fetch_placemaking_countries()
+            countries = await asyncio.to_thread(_fetch_placemaking_countries)
         except Exception as e:
             # Fallback to hardcoded mapping if Placemaking API fails
             return _COUNTRY_CODE_TO_NAME.get(country_code, f"Country lookup failed: {str(e)}")
@@ -741,7 +947,7 @@ Return ONLY valid JSON:
 
 
 @tool
-def get_area_polygon(area_name: str) -> str:
+async def get_area_polygon(area_name: str) -> str:
     """
     Fetches the GeoJSON polygon for a given area name (city, district, etc.).
     Example: 'Kadıköy', 'Beşiktaş', 'İstanbul'
@@ -750,7 +956,7 @@ def get_area_polygon(area_name: str) -> str:
     """
     try:
         # Step 1: Search for the area
-        results = _nominatim_get(
+        results = await _nominatim_get_async(
             "/search",
             {
                 "q": area_name,
@@ -801,7 +1007,7 @@ def get_area_polygon(area_name: str) -> str:
 
 
 @tool
-def search_places_by_text(query: str) -> str:
+async def search_places_by_text(query: str) -> str:
     """
     Performs a text-based place search using OpenStreetMap Nominatim.
     Example: 'Kadıköy restaurants', 'Beşiktaş cafes', 'Taksim pizza'
@@ -811,7 +1017,7 @@ def search_places_by_text(query: str) -> str:
     try:
         # Try original query first, then translated version
         translated_query = _translate_query(query)
-        amenity = _extract_amenity(translated_query) or _extract_amenity(query)
+        amenity = _extract_amenity_any(translated_query, query)
 
         base_params: dict = {
             "format": "json",
@@ -825,54 +1031,59 @@ def search_places_by_text(query: str) -> str:
         # If amenity detected, try structured search (amenity + city extracted from query)
         if amenity:
             # Extract area name by removing all amenity-related keywords from query
-            area = translated_query
-            for keyword in _AMENITY_TYPES:
-                area = re.sub(rf"\b{re.escape(keyword)}\b", "", area, flags=re.IGNORECASE)
+            area = _AMENITY_RE.sub("", translated_query)
             area = area.strip().strip(",").strip()
             if area:
                 structured = dict(base_params)
                 structured["amenity"] = amenity
                 structured["city"] = area
-                results = _nominatim_get("/search", structured)
+                results = await _nominatim_get_async("/search", structured)
 
-        # Fallback 1: free-text search with translated query
+        # Fallbacks 1+2: free-text search. When translation changed the query,
+        # fire both variants concurrently instead of waiting for the translated
+        # one to miss first; the translated result wins when both return hits.
         if not results:
-            results = _nominatim_get("/search", {**base_params, "q": translated_query})
-
-        # Fallback 2: original query if translation differs
-        if not results and translated_query != query:
-            results = _nominatim_get("/search", {**base_params, "q": query})
-
-        # Fallback 3: if we have an area, try broader free-text search with amenity keyword
+            if translated_query != query:
+                translated_res, original_res = await asyncio.gather(
+                    _nominatim_get_async("/search", {**base_params, "q": translated_query}),
+                    _nominatim_get_async("/search", {**base_params, "q": query}),
+                    return_exceptions=True,
+                )
+                if isinstance(translated_res, list) and translated_res:
+                    results = translated_res
+                elif isinstance(original_res, list) and original_res:
+                    results = original_res
+                elif isinstance(translated_res, BaseException) and isinstance(original_res, BaseException):
+                    # Both variants failed outright (outage/timeout) — surface
+                    # the error instead of reporting it as "no results".
+                    raise translated_res
+            else:
+                results = await _nominatim_get_async("/search", {**base_params, "q": translated_query})
+
+        # Fallback 3: if we have an area, try broader free-text search with amenity keyword.
+        # Precision is already degraded on this tier, so skip namedetails — the
+        # formatter falls back to display_name — and keep the payload smaller.
         if not results and amenity and area:
-            results = _nominatim_get("/search", {**base_params, "q": f"{amenity} {area}"})
+            light_params = {k: v for k, v in base_params.items() if k != "namedetails"}
+            results = await _nominatim_get_async("/search", {**light_params, "q": f"{amenity} {area}"})
 
         if not results:
             return f"No results found for '{query}'."
 
         output_lines = [f"Places found for '{query}':\n"]
-        for i, place in enumerate(results, 1):
-            namedetails = place.get("namedetails", {})
-            short_name = (
-                namedetails.get("name")
-                or namedetails.get("name:tr")
-                or namedetails.get("name:en")
-                or place.get("display_name", "Unknown").split(",")[0].strip()
-            )
-            address = place.get("display_name", "")
-            category = f"{place.get('class', 'place')} / {place.get('type', 'unknown')}"
-            lat = place.get("lat")
-            lon = place.get("lon")
-            osm_id = place.get("osm_id")
-            osm_type = place.get("osm_type")
-
-            output_lines.append(
-                f"{i}. {short_name}\n"
-                f"   📍 Coordinates: {lat}, {lon}\n"
-                f"   🏠 Address: {address}\n"
-                f"   🧭 Category: {category}\n"
-                f"   🆔 OSM: {osm_type}/{osm_id}\n"
+        output_lines += [
+            _PLACE_TMPL.format(
+                i=i,
+                name=_short_name(place),
+                lat=place.get("lat"),
+                lon=place.get("lon"),
+                addr=place.get("display_name", ""),
+                cat=f"{place.get('class', 'place')} / {place.get('type', 'unknown')}",
+                otype=place.get("osm_type"),
+                oid=place.get("osm_id"),
             )
+            for i, place in enumerate(results, 1)
+        ]
 
         return "\n".join(output_lines)
 
@@ -881,7 +1092,7 @@ def search_places_by_text(query: str) -> str:
 
 
 @tool
-def search_nearby_places(latitude: float, longitude: float, place_type: str, radius: int = 1500) -> str:
+async def search_nearby_places(latitude: float, longitude: float, place_type: str, radius: int = 1500) -> str:
     """
     Searches for nearby places around specific coordinates using Overpass.
     Args:
@@ -891,17 +1102,15 @@ def search_nearby_places(latitude: float, longitude: float, place_type: str, rad
         radius: Search radius in meters (default: 1500)
     """
     try:
+        # nwr covers node+way+relation in one index scan; the tight timeout
+        # lets a congested mirror fail fast so our fallbacks fire sooner.
         overpass_query_str = f"""
-        [out:json][timeout:20];
-        (
-          node["amenity"="{place_type}"](around:{radius},{latitude},{longitude});
-          way["amenity"="{place_type}"](around:{radius},{latitude},{longitude});
-          relation["amenity"="{place_type}"](around:{radius},{latitude},{longitude});
-        );
+        [out:json][timeout:10];
+        nwr["amenity"="{place_type}"](around:{radius},{latitude},{longitude});
         out center 20;
         """
         try:
-            data = _overpass_query(overpass_query_str)
+            data = await _overpass_query_async(overpass_query_str)
             elements = data.get("elements", [])
         except Exception:
             elements = []
@@ -915,7 +1124,7 @@ def search_nearby_places(latitude: float, longitude: float, place_type: str, rad
                 f"{longitude - deg_offset},{latitude + deg_offset},"
                 f"{longitude + deg_offset},{latitude - deg_offset}"
             )
-            fallback_results = _nominatim_get(
+            fallback_results = await _nominatim_get_async(
                 "/search",
                 {
                     "amenity": nominatim_amenity,
@@ -929,7 +1138,7 @@ def search_nearby_places(latitude: float, longitude: float, place_type: str, rad
             )
             if not fallback_results:
                 # wider search without bounding box
-                fallback_results = _nominatim_get(
+                fallback_results = await _nominatim_get_async(
                     "/search",
                     {
                         "q": f"{nominatim_amenity} near {latitude},{longitude}",
@@ -943,42 +1152,26 @@ def search_nearby_places(latitude: float, longitude: float, place_type: str, rad
                 return f"No '{place_type}' found within {radius}m of ({latitude}, {longitude})."
 
             output_lines = [f"'{place_type}' places near ({latitude}, {longitude}) (Nominatim):\n"]
-            for i, place in enumerate(fallback_results, 1):
-                namedetails = place.get("namedetails", {})
-                name = (
-                    namedetails.get("name")
-                    or namedetails.get("name:tr")
-                    or namedetails.get("name:en")
-                    or place.get("display_name", "Unknown").split(",")[0].strip()
-                )
-                lat_p = place.get("lat")
-                lon_p = place.get("lon")
-                address = place.get("display_name", "")
-                output_lines.append(
-                    f"{i}. {name}\n"
-                    f"   📍 Coordinates: {lat_p}, {lon_p}\n"
-                    f"   🏠 Address: {address}\n"
+            output_lines += [
+                _NEARBY_NOMINATIM_TMPL.format(
+                    i=i,
+                    name=_short_name(place),
+                    lat=place.get("lat"),
+                    lon=place.get("lon"),
+                    addr=place.get("display_name", ""),
                 )
+                for i, place in enumerate(fallback_results, 1)
+            ]
             return "\n".join(output_lines)
 
+        # Drop elements without usable coordinates before they spend a slot
+        # in the 20-result window; islice avoids materializing a copy.
+        located = (e for e in elements if "center" in e or "lat" in e)
         output_lines = [f"'{place_type}' places near ({latitude}, {longitude}) ({radius}m):\n"]
-        for i, element in enumerate(elements[:20], 1):
-            tags = element.get("tags", {})
-            name = tags.get("name") or tags.get("name:tr") or tags.get("name:en") or "Unknown"
-            address = _format_address(tags)
-            center = element.get("center") or {"lat": element.get("lat"), "lon": element.get("lon")}
-            lat_e = center.get("lat")
-            lon_e = center.get("lon")
-            osm_id = element.get("id")
-            osm_type = element.get("type")
-
-            output_lines.append(
-                f"{i}. {name}\n"
-                f"   📍 Address: {address}\n"
-                f"   🧭 Coordinates: {lat_e}, {lon_e}\n"
-                f"   🆔 OSM: {osm_type}/{osm_id}\n"
-            )
-
+        output_lines += [
+            _format_overpass_element(i, element)
+            for i, element in enumerate(islice(located, 20), 1)
+        ]
         return "\n".join(output_lines)
 
     except Exception as e:
@@ -986,14 +1179,14 @@ def search_nearby_places(latitude: float, longitude: float, place_type: str, rad
 
 
 @tool
-def geocode_location(address: str) -> str:
+async def geocode_location(address: str) -> str:
     """
     Converts an address or area name to coordinates using Nominatim.
     Args:
         address: Address or area name (e.g.: 'Kadıköy, Istanbul', 'Beşiktaş')
     """
     try:
-        results = _nominatim_get(
+        results = await _nominatim_get_async(
             "/search",
             {
                 "q": address,
@@ -1018,8 +1211,29 @@ def geocode_location(address: str) -> str:
         return f"An error occurred during geocoding: {str(e)}"
 
 
+# Nominatim /lookup expects single-letter prefixed ids (N123, W456, R789)
+_OSM_TYPE_PREFIX = {"node": "N", "way": "W", "relation": "R"}
+
+
+async def _lookup_many(osm_ids: list[str]) -> list[dict]:
+    """
+    Resolves one or more prefixed OSM ids (e.g. ['N123', 'W456']) with a
+    single Nominatim /lookup call — callers can batch ids into one hop.
+    """
+    return await _nominatim_get_async(
+        "/lookup",
+        {
+            "osm_ids": ",".join(osm_ids),
+            "format": "json",
+            "addressdetails": 1,
+            "namedetails": 1,
+            "extratags": 1,
+        },
+    )
+
+
 @tool
-def get_place_details(place_id: str) -> str:
+async def get_place_details(place_id: str) -> str:
     """
     Retrieves detailed information about a place from OSM.
     Args:
@@ -1033,23 +1247,38 @@ def get_place_details(place_id: str) -> str:
         if osm_type not in {"node", "way", "relation"}:
             return "Place id must be in the form 'node/123', 'way/456', or 'relation/789'."
 
-        query = f"""
-        [out:json];
-        {osm_type}({osm_id});
-        out body;
-        """
-        data = _overpass_query(query)
-        elements = data.get("elements", [])
-        if not elements:
-            return f"No place details found for '{place_id}'."
-
-        element = elements[0]
-        tags = element.get("tags", {})
-        name = tags.get("name", "Unknown")
-        address = _format_address(tags)
-        phone = tags.get("phone", "No phone")
-        website = tags.get("website", "No website")
-        category = f"{tags.get('amenity', 'place')}"
+        # Nominatim /lookup answers in one fast hop; Overpass (often queued
+        # for seconds) is kept only as a fallback.
+        try:
+            results = await _lookup_many([f"{_OSM_TYPE_PREFIX[osm_type]}{osm_id}"])
+        except Exception:
+            results = []
+
+        if results:
+            place = results[0]
+            extratags = place.get("extratags") or {}
+            name = _short_name(place)
+            address = place.get("display_name", "No address")
+            phone = extratags.get("phone") or extratags.get("contact:phone") or "No phone"
+            website = extratags.get("website") or extratags.get("contact:website") or "No website"
+            category = place.get("type", "place")
+        else:
+            query = f"""
+            [out:json];
+            {osm_type}({osm_id});
+            out body;
+            """
+            data = await _overpass_query_async(query)
+            elements = data.get("elements", [])
+            if not elements:
+                return f"No place details found for '{place_id}'."
+
+            tags = elements[0].get("tags", {})
+            name = tags.get("name", "Unknown")
+            address = _format_address(tags)
+            phone = tags.get("phone", "No phone")
+            website = tags.get("website", "No website")
+            category = f"{tags.get('amenity', 'place')}"
 
         return (
             f"🏪 {name}\n"